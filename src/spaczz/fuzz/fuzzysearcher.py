@@ -1,12 +1,14 @@
 """Module for FuzzySearcher class. Does fuzzy matching in spaCy Docs."""
-from itertools import chain
-from typing import Callable, Dict, List, Tuple, Union
+import bisect
+import heapq
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 import warnings
 
 from rapidfuzz import fuzz
 from spacy.tokens import Doc
 
 from ..exceptions import FlexWarning
+from ..process import map_tokens_to_chars
 
 
 class FuzzySearcher:
@@ -22,7 +24,7 @@ class FuzzySearcher:
     settings.
 
     Attributes:
-        _fuzzy_funcs (Dict[str, Callable[[str, str], int]]):
+        _fuzzy_funcs (Dict[str, Callable[..., float]]):
             Fuzzy matching functions accessible
             by their given key name. All rapidfuzz matchers
             with default settings are currently available:
@@ -35,11 +37,16 @@ class FuzzySearcher:
             "quick" = fuzz.QRatio
             "weighted" = fuzz.WRatio
             "quick_lev" = fuzz.quick_lev_ratio
+        _cutoff_funcs (Set[str]):
+            Key names of the fuzzy matching functions that can be
+            given min ratios as a rapidfuzz score_cutoff.
+            rapidfuzz 0.x token_set_ratio and WRatio can return 0
+            for ratios above the cutoff, so they are not included.
     """
 
     def __init__(self) -> None:
         """Initializes a fuzzy searcher with the given config."""
-        self._fuzzy_funcs: Dict[str, Callable[[str, str], int]] = {
+        self._fuzzy_funcs: Dict[str, Callable[..., float]] = {
             "simple": fuzz.ratio,
             "partial": fuzz.partial_ratio,
             "token_set": fuzz.token_set_ratio,
@@ -50,14 +57,29 @@ class FuzzySearcher:
             "weighted": fuzz.WRatio,
             "quick_lev": fuzz.quick_lev_ratio,
         }
+        self._cutoff_funcs: Set[str] = {
+            "simple",
+            "partial",
+            "token_sort",
+            "partial_token_set",
+            "partial_token_sort",
+            "quick",
+            "quick_lev",
+        }
 
     def compare(
-        self, str1: str, str2: str, fuzzy_func: str = "simple", ignore_case: bool = True
+        self,
+        str1: str,
+        str2: str,
+        fuzzy_func: str = "simple",
+        ignore_case: bool = True,
+        min_r: int = 0,
     ) -> int:
         """Peforms fuzzy matching between two strings.
 
         Applies the given fuzzy matching algorithm (fuzzy_func)
         to two strings and returns the resulting fuzzy ratio.
+        Ratios below min_r are returned as 0.
 
         Args:
             str1: First string for comparison.
@@ -77,9 +99,14 @@ class FuzzySearcher:
                 Default is "simple".
             ignore_case: Whether to lower-case str1 and str2
                 before comparison or not. Default is True.
+            min_r: Minimum fuzzy match ratio required. Where the
+                fuzzy matching function allows it, it is passed
+                to rapidfuzz as a score cutoff so dissimilar strings
+                can be rejected without computing the full ratio.
+                Default is 0.
 
         Returns:
-            The fuzzy ratio between a and b.
+            The fuzzy ratio between a and b or 0 if it is below min_r.
 
         Example:
             >>> from spaczz.fuzz import FuzzySearcher
@@ -90,11 +117,17 @@ class FuzzySearcher:
         if ignore_case:
             str1 = str1.lower()
             str2 = str2.lower()
-        return round(self.get_fuzzy_func(fuzzy_func, ignore_case)(str1, str2))
+        return self._ratio(
+            self.get_fuzzy_func(fuzzy_func, ignore_case),
+            str1,
+            str2,
+            min_r,
+            fuzzy_func in self._cutoff_funcs,
+        )
 
     def get_fuzzy_func(
         self, fuzzy_func: str, ignore_case: bool = True
-    ) -> Callable[[str, str], int]:
+    ) -> Callable[..., float]:
         """Returns a fuzzy matching function based on it's key name.
 
         Args:
@@ -120,9 +153,9 @@ class FuzzySearcher:
         except KeyError:
             raise ValueError(
                 (
-                    f"No fuzzy matching function called {fuzzy_func}.",
-                    "Matcher must be in the following:",
-                    f"{list(self._fuzzy_funcs.keys())}",
+                    f"No fuzzy matching function called {fuzzy_func}. "
+                    "Matcher must be in the following: "
+                    f"{list(self._fuzzy_funcs.keys())}"
                 )
             )
 
@@ -207,34 +240,136 @@ class FuzzySearcher:
             raise TypeError("doc must be a Doc object.")
         if not isinstance(query, Doc):
             raise TypeError("query must be a Doc object.")
+        return self._match(doc, query, n, fuzzy_func, min_r1, min_r2, ignore_case, flex)
+
+    def _match(
+        self,
+        doc: Doc,
+        query: Doc,
+        n: int = 0,
+        fuzzy_func: str = "simple",
+        min_r1: int = 25,
+        min_r2: int = 75,
+        ignore_case: bool = True,
+        flex: Union[str, int] = "default",
+    ) -> List[Tuple[int, int, int]]:
+        """Returns the n best fuzzy matches in a Doc without checking input types.
+
+        Does the work of match for callers that have already
+        made sure doc and query are Doc objects.
+        See match for details on the arguments.
+
+        Args:
+            doc: Doc object to search over.
+            query: Doc object to fuzzy match against doc.
+            n: Max number of matches to return.
+                If n is 0 all matches will be returned.
+            fuzzy_func: Key name of fuzzy matching function to use.
+            min_r1: Minimum fuzzy match ratio required for
+                selection during the intial search over doc.
+            min_r2: Minimum fuzzy match ratio required for
+                selection during match optimization.
+            ignore_case: If strings should be lower-cased before
+                fuzzy matching or not.
+            flex: Number of tokens to move match span boundaries
+                left and right during match optimization.
+
+        Returns:
+            A list of tuples of match span start indices,
+            end indices, and fuzzy match ratios.
+
+        Example:
+            >>> import spacy
+            >>> from spaczz.fuzz import FuzzySearcher
+            >>> nlp = spacy.blank("en")
+            >>> searcher = FuzzySearcher()
+            >>> doc = nlp.make_doc("cow, cow, cow, cow")
+            >>> query = nlp.make_doc("cow")
+            >>> searcher._match(doc, query, n=2)
+            [(0, 1, 100), (2, 3, 100)]
+        """
         if n == 0:
             n = int(len(doc) / len(query) + 2)
         flex = self._calc_flex(query, flex)
-        match_values = self._scan_doc(doc, query, fuzzy_func, min_r1, ignore_case)
-        if match_values:
-            positions = self._indice_maxes(match_values, n)
-            matches_w_nones = [
-                self._adjust_left_right_positions(
-                    doc,
-                    query,
-                    match_values,
-                    pos,
-                    fuzzy_func,
-                    min_r2,
-                    ignore_case,
-                    flex,
-                )
-                for pos in positions
-            ]
-            matches = [match for match in matches_w_nones if match]
-            if matches:
-                sorted_matches = sorted(matches, key=lambda x: (-x[2], x[0]))
-                filtered_matches = self._filter_overlapping_matches(sorted_matches)
-                return filtered_matches
-            else:
-                return []
-        else:
+        doc_chars = map_tokens_to_chars(doc, ignore_case)
+        match_values = self._scan_doc(
+            doc, query, fuzzy_func, min_r1, ignore_case, doc_chars
+        )
+        if not match_values:
             return []
+        positions = self._indice_maxes(match_values, n)
+        matches_w_nones = [
+            self._adjust_left_right_positions(
+                doc,
+                query,
+                match_values,
+                pos,
+                fuzzy_func,
+                min_r2,
+                ignore_case,
+                flex,
+                doc_chars,
+            )
+            for pos in positions
+        ]
+        matches = [match for match in matches_w_nones if match]
+        sorted_matches = sorted(matches, key=lambda x: (-x[2], x[0]))
+        return self._filter_overlapping_matches(sorted_matches)
+
+    def scan(
+        self,
+        doc: Doc,
+        queries: List[Doc],
+        fuzzy_func: str = "simple",
+        min_r1: int = 25,
+        ignore_case: bool = True,
+    ) -> List[Dict[int, int]]:
+        """Returns the initial fuzzy matches of several queries in a Doc.
+
+        Does the same search over doc as the first step of match,
+        but for every query in queries, mapping doc to text only once.
+        Match span boundaries are not flexed.
+
+        Args:
+            doc: Doc object to search over.
+            queries: Doc objects to fuzzy match against doc.
+            fuzzy_func: Key name of fuzzy matching function to use.
+                All rapidfuzz matching functions with default settings
+                are available. See match for the full list.
+                Default is "simple".
+            min_r1: Minimum fuzzy match ratio required for selection.
+                Default is 25.
+            ignore_case: If strings should be lower-cased before
+                fuzzy matching or not. Default is True.
+
+        Returns:
+            A list with a Dict of start index, fuzzy match ratio pairs
+            for each query in queries, in the same order.
+            Each span has len(query) tokens.
+
+        Raises:
+            TypeError: doc must be a Doc object.
+            TypeError: queries must all be Doc objects.
+
+        Example:
+            >>> import spacy
+            >>> from spaczz.fuzz import FuzzySearcher
+            >>> nlp = spacy.blank("en")
+            >>> searcher = FuzzySearcher()
+            >>> doc = nlp.make_doc("Don't call me Sh1rley.")
+            >>> queries = [nlp.make_doc("Shirley"), nlp.make_doc("call")]
+            >>> searcher.scan(doc, queries, min_r1=50)
+            [{4: 86}, {2: 100}]
+        """
+        if not isinstance(doc, Doc):
+            raise TypeError("doc must be a Doc object.")
+        if not all(isinstance(query, Doc) for query in queries):
+            raise TypeError("queries must all be Doc objects.")
+        doc_chars = map_tokens_to_chars(doc, ignore_case)
+        return [
+            self._scan_doc(doc, query, fuzzy_func, min_r1, ignore_case, doc_chars) or {}
+            for query in queries
+        ]
 
     def _adjust_left_right_positions(
         self,
@@ -246,6 +381,7 @@ class FuzzySearcher:
         min_r2: int,
         ignore_case: bool,
         flex: int,
+        doc_chars: Optional[Tuple[str, List[int], List[int]]] = None,
     ) -> Union[Tuple[int, int, int], None]:
         """Optimizes a fuzzy match by flexing match span boundaries.
 
@@ -270,6 +406,9 @@ class FuzzySearcher:
                 fuzzy matching or not.
             flex: Number of tokens to move match span boundaries
                 left and right during match optimization.
+            doc_chars: Output of map_tokens_to_chars for doc
+                with the same ignore_case, if already computed.
+                Otherwise only the region around pos is mapped.
 
         Returns:
             A tuple of left boundary index,
@@ -291,51 +430,158 @@ class FuzzySearcher:
         """
         p_l, bp_l = [pos] * 2
         p_r, bp_r = [pos + len(query)] * 2
-        bmv_l = match_values[p_l]
-        bmv_r = match_values[p_l]
-        if flex:
-            for f in range(1, flex + 1):
-                ll = self.compare(
-                    query.text, doc[p_l - f : p_r].text, fuzzy_func, ignore_case
+        if not flex:
+            # The boundaries cannot move so the initial ratio is final.
+            if match_values[p_l] >= min_r2:
+                return (p_l, p_r, match_values[p_l])
+            return None
+        # Lower-case once here instead of in compare for every candidate.
+        query_text = query.text.lower() if ignore_case else query.text
+        scorer = self.get_fuzzy_func(fuzzy_func, ignore_case)
+        use_cutoff = fuzzy_func in self._cutoff_funcs
+        if doc_chars is None:
+            # Only map the region that can be flexed into.
+            lo = max(pos - flex, 0)
+            doc_chars = map_tokens_to_chars(
+                doc[lo : pos + len(query) + flex], ignore_case
+            )
+        else:
+            lo = 0
+        text, starts, ends = doc_chars
+        # match_values is keyed by start index, so both boundaries start
+        # from the ratio of the initial span, doc[p_l:p_r].
+        bmv_l = bmv_r = match_values[p_l]
+        # Ratios already computed for this match, keyed by span text.
+        scores = {self._span_text(text, starts, ends, p_l - lo, p_r - lo): bmv_l}
+        # Candidates must beat the current best ratio, so pass that
+        # as the cutoff, where allowed, to let rapidfuzz give up early.
+        for f in range(1, flex + 1):
+            # Only probe boundaries that stay inside doc and the span.
+            if p_l - f >= 0:
+                ll = self._memo_compare(
+                    scores,
+                    query_text,
+                    self._span_text(text, starts, ends, p_l - f - lo, p_r - lo),
+                    scorer,
+                    bmv_l + 1,
+                    use_cutoff,
                 )
-                if (ll > bmv_l) and (p_l - f >= 0):
+                if ll > bmv_l:
                     bmv_l = ll
                     bp_l = p_l - f
-                lr = self.compare(
-                    query.text, doc[p_l + f : p_r].text, fuzzy_func, ignore_case
+            if p_l + f < p_r:
+                lr = self._memo_compare(
+                    scores,
+                    query_text,
+                    self._span_text(text, starts, ends, p_l + f - lo, p_r - lo),
+                    scorer,
+                    bmv_l + 1,
+                    use_cutoff,
                 )
-                if (lr > bmv_l) and (p_l + f < p_r):
+                if lr > bmv_l:
                     bmv_l = lr
                     bp_l = p_l + f
-                rl = self.compare(
-                    query.text, doc[p_l : p_r - f].text, fuzzy_func, ignore_case
+            if p_r - f > p_l:
+                rl = self._memo_compare(
+                    scores,
+                    query_text,
+                    self._span_text(text, starts, ends, p_l - lo, p_r - f - lo),
+                    scorer,
+                    bmv_r + 1,
+                    use_cutoff,
                 )
-                if (rl > bmv_r) and (p_r - f > p_l):
+                if rl > bmv_r:
                     bmv_r = rl
                     bp_r = p_r - f
-                rr = self.compare(
-                    query.text, doc[p_l : p_r + f].text, fuzzy_func, ignore_case
+            if p_r + f <= len(doc):
+                rr = self._memo_compare(
+                    scores,
+                    query_text,
+                    self._span_text(text, starts, ends, p_l - lo, p_r + f - lo),
+                    scorer,
+                    bmv_r + 1,
+                    use_cutoff,
                 )
-                if rr > bmv_r and (p_r + f <= len(doc)):
+                if rr > bmv_r:
                     bmv_r = rr
                     bp_r = p_r + f
-        r = self.compare(query.text, doc[bp_l:bp_r].text, fuzzy_func, ignore_case)
+        r = self._memo_compare(
+            scores,
+            query_text,
+            self._span_text(text, starts, ends, bp_l - lo, bp_r - lo),
+            scorer,
+            min_r2,
+            use_cutoff,
+        )
         if r >= min_r2:
             return (bp_l, bp_r, r)
         return None
 
+    def _memo_compare(
+        self,
+        scores: Dict[str, int],
+        query_text: str,
+        window: str,
+        scorer: Callable[..., float],
+        min_r: int,
+        use_cutoff: bool,
+    ) -> int:
+        """Compares query_text to window, reusing ratios stored in scores.
+
+        Only ratios that met their min_r are stored,
+        since rapidfuzz may stop early on the others.
+        Expects both strings to already be lower-cased if needed.
+
+        Args:
+            scores: Dict of window texts and their fuzzy ratios
+                against query_text. Updated in place.
+            query_text: Text of the query.
+            window: Text of the span being compared.
+            scorer: Fuzzy matching function to use.
+            min_r: Minimum fuzzy match ratio required.
+            use_cutoff: Whether min_r can be passed to scorer
+                as a score cutoff or not.
+
+        Returns:
+            The fuzzy ratio between query_text and window or 0.
+
+        Example:
+            >>> from rapidfuzz import fuzz
+            >>> from spaczz.fuzz import FuzzySearcher
+            >>> searcher = FuzzySearcher()
+            >>> scores = {"spacy": 73}
+            >>> searcher._memo_compare(scores, "spaczz", "spacy", fuzz.ratio, 50, True)
+            73
+        """
+        if window in scores:
+            return scores[window]
+        ratio = self._ratio(scorer, query_text, window, min_r, use_cutoff)
+        if ratio or not min_r:
+            scores[window] = ratio
+        return ratio
+
     def _scan_doc(
-        self, doc: Doc, query: Doc, fuzzy_func: str, min_r1: int, ignore_case: bool
+        self,
+        doc: Doc,
+        query: Doc,
+        fuzzy_func: str,
+        min_r1: int,
+        ignore_case: bool,
+        doc_chars: Optional[Tuple[str, List[int], List[int]]] = None,
     ) -> Union[Dict[int, int], None]:
         """Returns a Dict of potential match start indices and fuzzy ratios.
 
-        Iterates through the doc by spans of query length,
-        and fuzzy matches each span gainst query.
+        Collects the text of every span of query length in doc
+        in a single pass, then fuzzy matches each span against query.
 
         If a match span's fuzzy ratio is greater than or equal to the
         min_r1 it is added to a dict with it's start index
         as the key and it's ratio as the value.
 
+        With the "simple" fuzzy_func, spans whose length differs
+        too much from the query to reach min_r1 are skipped
+        without being compared.
+
         Args:
             doc: Doc object to search over.
             query: Doc object to fuzzy match against doc.
@@ -351,6 +597,8 @@ class FuzzySearcher:
                 but will run slower.
             ignore_case: If strings should be lower-cased before
                 fuzzy matching or not.
+            doc_chars: Output of map_tokens_to_chars for doc
+                with the same ignore_case, if already computed.
 
         Returns:
             A Dict of start index, fuzzy match ratio pairs or None.
@@ -367,15 +615,29 @@ class FuzzySearcher:
                 ignore_case=True)
             {4: 86}
         """
+        # Lower-case once here instead of in compare for every window.
+        query_text = query.text.lower() if ignore_case else query.text
+        scorer = self.get_fuzzy_func(fuzzy_func, ignore_case)
+        use_cutoff = fuzzy_func in self._cutoff_funcs
+        query_len = len(query)
+        if doc_chars is None:
+            doc_chars = map_tokens_to_chars(doc, ignore_case)
+        text, starts, ends = doc_chars
+        # Window i spans tokens i to i + query_len - 1.
+        windows = [text[start:end] for start, end in zip(starts, ends[query_len - 1 :])]
+        query_chars = len(query_text)
+        # fuzz.ratio is at most 100 * (1 - |la - lb| / (la + lb)),
+        # the extra 0.5 allows for rounding the ratio up to min_r1.
+        max_len_diff = (100.5 - min_r1) / 100 if fuzzy_func == "simple" else None
         match_values: Dict[int, int] = dict()
-        i = 0
-        while i + len(query) <= len(doc):
-            match = self.compare(
-                query.text, doc[i : i + len(query)].text, fuzzy_func, ignore_case
-            )
+        for i, window in enumerate(windows):
+            if max_len_diff is not None and abs(
+                len(window) - query_chars
+            ) > max_len_diff * (len(window) + query_chars):
+                continue
+            match = self._ratio(scorer, query_text, window, min_r1, use_cutoff)
             if match >= min_r1:
                 match_values[i] = match
-            i += 1
         if match_values:
             return match_values
         else:
@@ -426,6 +688,86 @@ class FuzzySearcher:
             raise TypeError("Flex must be either the string 'default' or an integer.")
         return flex
 
+    @staticmethod
+    def _ratio(
+        scorer: Callable[..., float],
+        str1: str,
+        str2: str,
+        min_r: int,
+        use_cutoff: bool = True,
+    ) -> int:
+        """Returns the rounded fuzzy ratio of two strings or 0 if below min_r.
+
+        Does the work of compare with an already resolved
+        fuzzy matching function and no case handling,
+        so it can be called directly in loops.
+
+        Args:
+            scorer: Fuzzy matching function to use.
+            str1: First string for comparison.
+            str2: Second string for comparison.
+            min_r: Minimum fuzzy match ratio required.
+            use_cutoff: Whether min_r can be passed to scorer
+                as a score cutoff or not. If False the full ratio
+                is computed and min_r is applied after rounding.
+                Default is True.
+
+        Returns:
+            The fuzzy ratio between str1 and str2 or 0 if it is below min_r.
+
+        Example:
+            >>> from rapidfuzz import fuzz
+            >>> from spaczz.fuzz import FuzzySearcher
+            >>> searcher = FuzzySearcher()
+            >>> searcher._ratio(fuzz.ratio, "spaczz", "spacy", 50)
+            73
+        """
+        if use_cutoff:
+            # rapidfuzz applies score_cutoff to the unrounded ratio.
+            ratio = round(scorer(str1, str2, score_cutoff=max(min_r - 0.5, 0)))
+        else:
+            ratio = round(scorer(str1, str2))
+        if ratio >= min_r:
+            return ratio
+        return 0
+
+    @staticmethod
+    def _span_text(
+        text: str, starts: List[int], ends: List[int], start: int, end: int
+    ) -> str:
+        """Returns the text of the tokens from start to end.
+
+        Slices text using token character boundaries from map_tokens_to_chars
+        instead of building a Span and rebuilding its text.
+        start and end are clamped to the available tokens.
+
+        Args:
+            text: Text the token character boundaries refer to.
+            starts: Start character index of each token.
+            ends: End character index of each token.
+            start: Index of the first token.
+            end: Index after the last token.
+
+        Returns:
+            The text of the tokens or an empty string if there are none.
+
+        Example:
+            >>> import spacy
+            >>> from spaczz.fuzz import FuzzySearcher
+            >>> from spaczz.process import map_tokens_to_chars
+            >>> nlp = spacy.blank("en")
+            >>> searcher = FuzzySearcher()
+            >>> doc = nlp.make_doc("Don't call me Sh1rley.")
+            >>> text, starts, ends = map_tokens_to_chars(doc)
+            >>> searcher._span_text(text, starts, ends, 2, 4)
+            'call me'
+        """
+        start = max(start, 0)
+        end = min(end, len(starts))
+        if start >= end:
+            return ""
+        return text[starts[start] : ends[end - 1]]
+
     @staticmethod
     def _filter_overlapping_matches(
         matches: List[Tuple[int, int, int]]
@@ -452,11 +794,19 @@ class FuzzySearcher:
             [(1, 3, 80)]
         """
         filtered_matches: List[Tuple[int, int, int]] = []
+        # Kept spans never overlap, so sorted by start they are also sorted by end.
+        kept_starts: List[int] = []
+        kept_ends: List[int] = []
         for match in matches:
-            if not set(range(match[0], match[1])).intersection(
-                chain(*[set(range(n[0], n[1])) for n in filtered_matches])
+            start, end = match[0], match[1]
+            i = bisect.bisect_right(kept_starts, start)
+            if (i and kept_ends[i - 1] > start) or (
+                i < len(kept_starts) and kept_starts[i] < end
             ):
-                filtered_matches.append(match)
+                continue
+            kept_starts.insert(i, start)
+            kept_ends.insert(i, end)
+            filtered_matches.append(match)
         return filtered_matches
 
     @staticmethod
@@ -484,6 +834,6 @@ class FuzzySearcher:
             [9, 4, 5]
         """
         if n:
-            return sorted(match_values, key=lambda x: (-match_values[x], x))[:n]
+            return heapq.nsmallest(n, match_values, key=lambda x: (-match_values[x], x))
         else:
             return list(match_values.keys())
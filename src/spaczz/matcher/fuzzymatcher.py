@@ -12,6 +12,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
@@ -87,6 +88,9 @@ class FuzzyMatcher(FuzzySearcher):
         Returns:
             A list of (key, start, end, ratio) tuples, describing the matches.
 
+        Raises:
+            TypeError: doc must be a Doc object.
+
         Example:
             >>> import spacy
             >>> from spaczz.matcher import FuzzyMatcher
@@ -97,27 +101,24 @@ class FuzzyMatcher(FuzzySearcher):
             >>> matcher(doc)
             [('NAME', 0, 2, 91)]
         """
-        matches = set()
+        if not isinstance(doc, Doc):
+            raise TypeError("doc must be a Doc object.")
+        matches: Set[Tuple[str, int, int, int]] = set()
         for label, patterns in self._patterns.items():
             for pattern, kwargs in zip(patterns["patterns"], patterns["kwargs"]):
                 if not kwargs:
                     kwargs = self.defaults
-                matches_wo_label = self.match(doc, pattern, **kwargs)
-                if matches_wo_label:
-                    matches_w_label = [
-                        (label,) + match_wo_label for match_wo_label in matches_wo_label
-                    ]
-                    for match in matches_w_label:
-                        matches.add(match)
-        if matches:
-            sorted_matches = sorted(matches, key=lambda x: (x[1], -x[2] - x[1], -x[3]))
-            for i, (label, _start, _end, _ratio) in enumerate(sorted_matches):
-                on_match = self._callbacks.get(label)
-                if on_match:
-                    on_match(self, doc, i, sorted_matches)
-            return sorted_matches
-        else:
-            return []
+                # Patterns are checked in add and doc above.
+                matches_wo_label = self._match(doc, pattern, **kwargs)
+                matches.update(
+                    (label,) + match_wo_label for match_wo_label in matches_wo_label
+                )
+        sorted_matches = sorted(matches, key=lambda x: (x[1], -x[2] - x[1], -x[3]))
+        for i, (label, _start, _end, _ratio) in enumerate(sorted_matches):
+            on_match = self._callbacks.get(label)
+            if on_match:
+                on_match(self, doc, i, sorted_matches)
+        return sorted_matches
 
     def __contains__(self, label: str) -> bool:
         """Whether the matcher contains patterns for a label."""
@@ -12,6 +12,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
@@ -109,29 +110,21 @@ class RegexMatcher(RegexSearcher):
             >>> matcher(doc)
             [('GPE', 4, 6, (0, 0, 0)), ('GPE', 9, 10, (0, 0, 0))]
         """
-        matches = set()
+        matches: Set[Tuple[str, int, int, Tuple[int, int, int]]] = set()
         for label, patterns in self._patterns.items():
             for pattern, kwargs in zip(patterns["patterns"], patterns["kwargs"]):
                 if not kwargs:
                     kwargs = self.defaults
                 matches_wo_label = self.match(doc, pattern, **kwargs)
-                if matches_wo_label:
-                    matches_w_label = [
-                        (label,) + match_wo_label for match_wo_label in matches_wo_label
-                    ]
-                    for match in matches_w_label:
-                        matches.add(match)
-        if matches:
-            sorted_matches = sorted(
-                matches, key=lambda x: (x[1], -x[2] - x[1], sum(x[3]))
-            )
-            for i, (label, _start, _end, _subs) in enumerate(sorted_matches):
-                on_match = self._callbacks.get(label)
-                if on_match:
-                    on_match(self, doc, i, sorted_matches)
-            return sorted_matches
-        else:
-            return []
+                matches.update(
+                    (label,) + match_wo_label for match_wo_label in matches_wo_label
+                )
+        sorted_matches = sorted(matches, key=lambda x: (x[1], -x[2] - x[1], sum(x[3])))
+        for i, (label, _start, _end, _subs) in enumerate(sorted_matches):
+            on_match = self._callbacks.get(label)
+            if on_match:
+                on_match(self, doc, i, sorted_matches)
+        return sorted_matches
 
     def __contains__(self, label: str) -> bool:
         """Whether the matcher contains patterns for a label."""
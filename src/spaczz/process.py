@@ -1,7 +1,7 @@
 """Module for various text/doc processing functions."""
-from typing import Dict
+from typing import Dict, List, Tuple, Union
 
-from spacy.tokens import Doc
+from spacy.tokens import Doc, Span
 
 
 def map_chars_to_tokens(doc: Doc) -> Dict[int, int]:
@@ -13,5 +13,47 @@ def map_chars_to_tokens(doc: Doc) -> Dict[int, int]:
     return chars_to_tokens
 
 
+def map_tokens_to_chars(
+    doclike: Union[Doc, Span], lower: bool = False
+) -> Tuple[str, List[int], List[int]]:
+    """Maps tokens in doclike to their character boundaries in its text.
+
+    Returns the text of doclike with the start and end character index
+    of each token relative to that text, so the text of any run of
+    tokens can be sliced out instead of being rebuilt from the tokens.
+
+    If lower is True the text is built from lower-cased tokens,
+    which keeps the boundaries valid even if lower-casing changes
+    the length of a token.
+
+    Args:
+        doclike: Doc or Span object to map.
+        lower: Whether to build the text from lower-cased tokens or not.
+            Default is False.
+
+    Returns:
+        A tuple of the text, the start character index of each token
+        and the end character index of each token.
+    """
+    if not lower:
+        text = doclike.text
+        offset = doclike[0].idx if len(doclike) else 0
+        starts = [token.idx - offset for token in doclike]
+        ends = [start + len(token.text) for start, token in zip(starts, doclike)]
+        return text, starts, ends
+    texts = []
+    starts = []
+    ends = []
+    i = 0
+    for token in doclike:
+        texts.append(token.lower_)
+        texts.append(token.whitespace_)
+        starts.append(i)
+        i += len(token.lower_)
+        ends.append(i)
+        i += len(token.whitespace_)
+    return "".join(texts), starts, ends
+
+
 class MatchCleanerMixin:
     """To be implemented later."""
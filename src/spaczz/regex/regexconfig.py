@@ -1,5 +1,6 @@
 """Module for RegexPredef class."""
-from typing import Any
+from functools import lru_cache
+from typing import Any, Dict
 
 import regex
 
@@ -7,6 +8,22 @@ from ._commonregex import _commonregex
 from ..exceptions import RegexParseError
 
 
+@lru_cache(maxsize=256)
+def _compile_regex(regex_str: str) -> Any:
+    """Compiles regex_str, reusing the pattern if it was compiled before.
+
+    regex.compile keeps its own cache too, but a hit there still
+    rebuilds its cache key and checks the locale on every call.
+
+    Args:
+        regex_str: String to compile into a regex pattern.
+
+    Returns:
+        A compiled regex pattern.
+    """
+    return regex.compile(regex_str)
+
+
 class RegexConfig:
     """Class for parsing regex patterns and housing predefined regex patterns.
 
@@ -24,8 +41,10 @@ class RegexConfig:
                 patterns or not. Will be more useful later once API
                 is extended. Default is False.
         """
+        self._predefs: Dict[str, Any]
         if not empty:
-            self._predefs = _commonregex
+            # Copies the mapping only, the compiled patterns are shared.
+            self._predefs = dict(_commonregex)
         else:
             self._predefs = {}
 
@@ -75,7 +94,7 @@ class RegexConfig:
             compiled_regex = self.get_predef(regex_str)
         else:
             try:
-                compiled_regex = regex.compile(regex_str,)
+                compiled_regex = _compile_regex(regex_str)
             except (regex._regex_core.error, TypeError, ValueError) as e:
                 raise RegexParseError(e)
         return compiled_regex
@@ -100,10 +119,9 @@ class RegexConfig:
             >>> isinstance(pattern, type(regex.compile("type")))
             True
         """
-        predef_regex = self._predefs.get(predef)
-        if predef_regex:
-            return predef_regex
-        else:
+        try:
+            return self._predefs[predef]
+        except KeyError:
             raise ValueError(
-                f"{predef} is not a regex pattern defined in this RegexPredef instance."
+                f"{predef} is not a regex pattern defined in this RegexConfig instance."
             )
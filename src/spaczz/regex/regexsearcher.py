@@ -1,7 +1,18 @@
 """Module for the RegexSearcher class. Does multi-token regex matching in spaCy Docs."""
-from typing import List, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-from spacy.tokens import Doc, Span
+from spacy.tokens import Doc
 
 from .regexconfig import RegexConfig
 from ..process import map_chars_to_tokens
@@ -30,24 +41,29 @@ class RegexSearcher:
         Raises:
             TypeError: If config is not a RegexConfig object.
         """
-        if config == "default":
+        if isinstance(config, RegexConfig):
+            self._config = config
+        elif config == "default":
             self._config = RegexConfig(empty=False)
         elif config == "empty":
             self._config = RegexConfig(empty=True)
         else:
-            if isinstance(config, RegexConfig):
-                self._config = config
-            else:
-                raise TypeError(
-                    (
-                        "config must be one of the strings 'default' or 'empty',",
-                        "or a RegexConfig object not,",
-                        f"{config} of type: {type(config)}.",
-                    )
+            raise TypeError(
+                (
+                    "config must be one of the strings 'default' or 'empty', "
+                    "or a RegexConfig object, not "
+                    f"{config} of type: {type(config)}."
                 )
+            )
 
     def match(
-        self, doc: Doc, regex_str: str, partial: bool = True, predef: bool = False,
+        self,
+        doc: Doc,
+        regex_str: str,
+        partial: bool = True,
+        predef: bool = False,
+        overlapped: bool = False,
+        concurrent: bool = False,
     ) -> List[Tuple[int, int, Tuple[int, int, int]]]:
         """Returns all the regex matches within doc.
 
@@ -58,6 +74,8 @@ class RegexSearcher:
         will not do this to avoid this issue.
 
         To utilize regex flags, use inline flags.
+        For example, "(?b)" selects the best fuzzy match instead of the
+        first one found and "(?V1)" selects version 1 of the regex module.
 
         Args:
             doc: Doc object to search over.
@@ -86,13 +104,15 @@ class RegexSearcher:
                 "zip_codes"
                 "po_boxes"
                 "ssn_number".
+            overlapped: Whether to also return matches that overlap
+                other matches or not. Each span is only returned once.
+                Default is False.
+            concurrent: Whether the regex module should release the GIL
+                while matching, so other threads can run. Default is False.
 
         Returns:
             A list of span start index, end index, fuzzy change count tuples.
 
-        Raises:
-            TypeError: If regex_str is not a string.
-
         Example:
             >>> import spacy
             >>> from spaczz.regex import RegexSearcher
@@ -102,26 +122,182 @@ class RegexSearcher:
             >>> searcher.match(doc, "phones", predef=True)
             [(4, 10, (0, 0, 0))]
         """
+        compiled_regex = self._parse(regex_str, predef)
+        return self._match_pattern(doc, compiled_regex, partial, overlapped, concurrent)
+
+    def match_batch(
+        self,
+        docs: Iterable[Doc],
+        regex_str: str,
+        partial: bool = True,
+        predef: bool = False,
+        overlapped: bool = False,
+        concurrent: bool = False,
+    ) -> Iterator[List[Tuple[int, int, Tuple[int, int, int]]]]:
+        """Returns all the regex matches within each doc in docs.
+
+        Same as calling match on each doc, but regex_str is
+        checked and parsed only once for all of them.
+
+        Args:
+            docs: Doc objects to search over.
+            regex_str: A string to be compiled to regex,
+                or the key name of a predefined regex pattern.
+            partial: Whether partial matches should be extended
+                to existing span boundaries in doc or not.
+                Default is True.
+            predef: Whether regex should be interpreted as a key to
+                a predefined regex pattern or not. Default is False.
+                See match for the included regexes.
+            overlapped: Same as in match. Default is False.
+            concurrent: Same as in match. Default is False.
+
+        Returns:
+            An iterator over a list of span start index, end index,
+            fuzzy change count tuples for each doc, in the order of docs.
+
+        Example:
+            >>> import spacy
+            >>> from spaczz.regex import RegexSearcher
+            >>> nlp = spacy.blank("en")
+            >>> searcher = RegexSearcher()
+            >>> docs = nlp.pipe(["Call (555) 555-5555.", "No phone."])
+            >>> list(searcher.match_batch(docs, "phones", predef=True))
+            [[(1, 7, (0, 0, 0))], []]
+        """
+        compiled_regex = self._parse(regex_str, predef)
+        return (
+            self._match_pattern(doc, compiled_regex, partial, overlapped, concurrent)
+            for doc in docs
+        )
+
+    def get_matcher(
+        self, regex_str: str, predef: bool = False
+    ) -> Callable[..., List[Tuple[int, int, Tuple[int, int, int]]]]:
+        """Returns a function that finds the matches of one regex in a doc.
+
+        regex_str is checked and parsed once, so the returned function
+        skips that work when the same pattern is matched against
+        many docs.
+
+        Args:
+            regex_str: A string to be compiled to regex,
+                or the key name of a predefined regex pattern.
+            predef: Whether regex should be interpreted as a key to
+                a predefined regex pattern or not. Default is False.
+                See match for the included regexes.
+
+        Returns:
+            A function taking a doc and optionally partial, overlapped
+            and concurrent, with the same defaults as match,
+            that returns the same matches as match.
+
+        Example:
+            >>> import spacy
+            >>> from spaczz.regex import RegexSearcher
+            >>> nlp = spacy.blank("en")
+            >>> searcher = RegexSearcher()
+            >>> find_phones = searcher.get_matcher("phones", predef=True)
+            >>> find_phones(nlp.make_doc("My phone number is (555) 555-5555."))
+            [(4, 10, (0, 0, 0))]
+        """
+        compiled_regex = self._parse(regex_str, predef)
+
+        def matcher(
+            doc: Doc,
+            partial: bool = True,
+            overlapped: bool = False,
+            concurrent: bool = False,
+        ) -> List[Tuple[int, int, Tuple[int, int, int]]]:
+            return self._match_pattern(
+                doc, compiled_regex, partial, overlapped, concurrent
+            )
+
+        return matcher
+
+    def _parse(self, regex_str: str, predef: bool) -> Any:
+        """Checks regex_str and parses it with the searcher's config.
+
+        Args:
+            regex_str: A string to be compiled to regex,
+                or the key name of a predefined regex pattern.
+            predef: Whether regex should be interpreted as a key to
+                a predefined regex pattern or not.
+
+        Returns:
+            The compiled regex pattern.
+
+        Raises:
+            TypeError: If regex_str is not a string.
+
+        Example:
+            >>> from spaczz.regex import RegexSearcher
+            >>> searcher = RegexSearcher()
+            >>> searcher._parse("US", False).pattern
+            'US'
+        """
         if isinstance(regex_str, str):
-            compiled_regex = self._config.parse_regex(regex_str, predef)
-        else:
-            raise TypeError(f"regex_str must be a str, not {type(regex_str)}.")
+            return self._config.parse_regex(regex_str, predef)
+        raise TypeError(f"regex_str must be a str, not {type(regex_str)}.")
+
+    @staticmethod
+    def _match_pattern(
+        doc: Doc,
+        compiled_regex: Any,
+        partial: bool,
+        overlapped: bool = False,
+        concurrent: bool = False,
+    ) -> List[Tuple[int, int, Tuple[int, int, int]]]:
+        """Returns all the matches of a compiled regex pattern within doc.
+
+        Args:
+            doc: Doc object to search over.
+            compiled_regex: A compiled regex pattern.
+            partial: Whether partial matches should be extended
+                to existing span boundaries in doc or not.
+            overlapped: Same as in match. Default is False.
+            concurrent: Same as in match. Default is False.
+
+        Returns:
+            A list of span start index, end index, fuzzy change count tuples.
+
+        Example:
+            >>> import regex
+            >>> import spacy
+            >>> from spaczz.regex import RegexSearcher
+            >>> nlp = spacy.blank("en")
+            >>> searcher = RegexSearcher()
+            >>> doc = nlp.make_doc("We want the USA.")
+            >>> searcher._match_pattern(doc, regex.compile("US"), True)
+            [(3, 4, (0, 0, 0))]
+        """
         matches = []
-        chars_to_tokens = map_chars_to_tokens(doc)
-        for match in compiled_regex.finditer(doc.text):
+        # Only needed for partial matches, so built on first use.
+        chars_to_tokens: Optional[Dict[int, int]] = None
+        # Overlapping partial matches can be extended to the same span.
+        seen: Set[Tuple[int, int, Tuple[int, int, int]]] = set()
+        for match in compiled_regex.finditer(
+            doc.text, overlapped=overlapped, concurrent=concurrent
+        ):
             start, end = match.span()
             counts = match.fuzzy_counts
             span = doc.char_span(start, end)
             if span:
-                matches.append((span, counts))
+                token_match = (span.start, span.end, counts)
+            elif partial:
+                if chars_to_tokens is None:
+                    chars_to_tokens = map_chars_to_tokens(doc)
+                start_token = chars_to_tokens.get(start)
+                end_token = chars_to_tokens.get(end)
+                # Token 0 is a valid token index, so check for None.
+                if start_token is None or end_token is None:
+                    continue
+                token_match = (start_token, end_token + 1, counts)
             else:
-                if partial:
-                    start_token = chars_to_tokens.get(start)
-                    end_token = chars_to_tokens.get(end)
-                    if start_token and end_token:
-                        span = Span(doc, start_token, end_token + 1)
-                        matches.append((span, counts))
-        if matches:
-            return [(match[0].start, match[0].end, match[1]) for match in matches]
-        else:
-            return []
+                continue
+            if overlapped:
+                if token_match in seen:
+                    continue
+                seen.add(token_match)
+            matches.append(token_match)
+        return matches
@@ -2,12 +2,14 @@
 from typing import Dict
 
 import pytest
+from pytest_mock import MockFixture
 from rapidfuzz import fuzz
 from spacy.language import Language
 from spacy.tokens import Doc
 
 from spaczz.exceptions import FlexWarning
 from spaczz.fuzz.fuzzysearcher import FuzzySearcher
+from spaczz.process import map_tokens_to_chars
 
 
 @pytest.fixture
@@ -42,7 +44,7 @@ def test_get_fuzzy_alg_returns_alg(searcher: FuzzySearcher) -> None:
 
 def test_get_fuzzy_alg_raises_error_with_unknown_name(searcher: FuzzySearcher) -> None:
     """It raises a ValueError if fuzzy_func does not match a predefined key name."""
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="No fuzzy matching function called unkown."):
         searcher.get_fuzzy_func("unkown")
 
 
@@ -56,6 +58,38 @@ def test_compare_without_ignore_case(searcher: FuzzySearcher) -> None:
     assert searcher.compare("SPACZZ", "spaczz", ignore_case=False) == 0
 
 
+def test_compare_returns_0_below_min_r(searcher: FuzzySearcher) -> None:
+    """It returns 0 if the ratio is below min_r."""
+    assert searcher.compare("spaczz", "spacy", min_r=74) == 0
+
+
+def test_compare_keeps_ratio_that_rounds_to_min_r(searcher: FuzzySearcher) -> None:
+    """It applies min_r to the rounded ratio."""
+    assert searcher.compare("spaczz", "spacy", min_r=73) == 73
+
+
+def test_compare_with_token_set_and_min_r(searcher: FuzzySearcher) -> None:
+    """It returns token_set ratios that meet min_r."""
+    assert (
+        searcher.compare("- jabbar abdul ab", "ab Cow shirley", "token_set", min_r=30)
+        == 34
+    )
+
+
+def test_compare_with_weighted_and_min_r(searcher: FuzzySearcher) -> None:
+    """It returns weighted ratios that meet min_r."""
+    assert (
+        searcher.compare("kareem cow kareem", "over big jabbar", "weighted", min_r=41)
+        == 41
+    )
+
+
+def test__ratio_uses_given_scorer(searcher: FuzzySearcher) -> None:
+    """It applies the given fuzzy matching function without lower-casing."""
+    assert searcher._ratio(fuzz.ratio, "spaczz", "spacy", 73) == 73
+    assert searcher._ratio(fuzz.ratio, "SPACZZ", "spaczz", 0) == 0
+
+
 def test__calc_flex_with_default(nlp: Language, searcher: FuzzySearcher) -> None:
     """It returns len(query) if set with "default"."""
     query = nlp.make_doc("Test query.")
@@ -135,6 +169,19 @@ def test__scan_doc_with_no_matches(
     )
 
 
+def test__scan_doc_skips_windows_too_long_or_short_for_min_r1(
+    searcher: FuzzySearcher, nlp: Language, mocker: MockFixture
+) -> None:
+    """It does not compare windows that cannot reach min_r1 by length alone."""
+    doc = nlp.make_doc("a Shirley supercalifragilistic")
+    query = nlp.make_doc("Shirley")
+    spy = mocker.spy(searcher, "_ratio")
+    assert searcher._scan_doc(
+        doc, query, fuzzy_func="simple", min_r1=80, ignore_case=True
+    ) == {1: 100}
+    assert spy.call_count == 1
+
+
 def test__adjust_left_right_positions_finds_better_match(
     searcher: FuzzySearcher, nlp: Language
 ) -> None:
@@ -172,6 +219,25 @@ def test__adjust_left_right_positions_finds_better_match2(
     ) == (8, 11, 89)
 
 
+def test__adjust_left_right_positions_with_doc_chars(
+    searcher: FuzzySearcher, nlp: Language, adjust_example: Doc
+) -> None:
+    """It finds the same match when given the precomputed doc character map."""
+    query = nlp.make_doc("Kareem Abdul-Jabbar")
+    match_values = {0: 33, 1: 39, 2: 41, 3: 33, 5: 37, 6: 59, 7: 84}
+    assert searcher._adjust_left_right_positions(
+        adjust_example,
+        query,
+        match_values,
+        pos=7,
+        fuzzy_func="simple",
+        min_r2=70,
+        ignore_case=True,
+        flex=4,
+        doc_chars=map_tokens_to_chars(adjust_example, True),
+    ) == (8, 11, 89)
+
+
 def test__adjust_left_right_positions_with_no_flex(
     searcher: FuzzySearcher, nlp: Language
 ) -> None:
@@ -191,6 +257,85 @@ def test__adjust_left_right_positions_with_no_flex(
     ) == (3, 4, 94)
 
 
+def test__memo_compare_reuses_stored_ratio(
+    searcher: FuzzySearcher, mocker: MockFixture
+) -> None:
+    """It only scores windows it has not scored yet."""
+    spy = mocker.spy(searcher, "_ratio")
+    scores = {"spacy": 73}
+    assert searcher._memo_compare(scores, "spaczz", "spacy", fuzz.ratio, 50, True) == 73
+    assert (
+        searcher._memo_compare(scores, "spaczz", "spaczz", fuzz.ratio, 50, True) == 100
+    )
+    assert (
+        searcher._memo_compare(scores, "spaczz", "spaczz", fuzz.ratio, 50, True) == 100
+    )
+    assert spy.call_count == 1
+
+
+def test__memo_compare_does_not_store_ratio_below_min_r(
+    searcher: FuzzySearcher,
+) -> None:
+    """It does not store ratios cut off by min_r."""
+    scores: Dict[str, int] = {}
+    assert searcher._memo_compare(scores, "spaczz", "spacy", fuzz.ratio, 80, True) == 0
+    assert scores == {}
+
+
+def test__adjust_left_right_positions_with_no_flex_does_not_rescore(
+    searcher: FuzzySearcher, nlp: Language, mocker: MockFixture
+) -> None:
+    """It reuses the initial ratio when flex value = 0."""
+    doc = nlp.make_doc("Patient was prescribed Zithroma tablets.")
+    query = nlp.make_doc("zithromax")
+    spy = mocker.spy(searcher, "_ratio")
+    assert (
+        searcher._adjust_left_right_positions(
+            doc,
+            query,
+            {3: 94},
+            pos=3,
+            fuzzy_func="simple",
+            min_r2=95,
+            ignore_case=True,
+            flex=0,
+        )
+        is None
+    )
+    assert spy.call_count == 0
+
+
+def test__adjust_left_right_positions_skips_out_of_bounds_probes(
+    searcher: FuzzySearcher, nlp: Language, mocker: MockFixture
+) -> None:
+    """It does not score boundaries outside of doc."""
+    doc = nlp.make_doc("Zithromax")
+    query = nlp.make_doc("zithromax")
+    spy = mocker.spy(searcher, "_ratio")
+    assert searcher._adjust_left_right_positions(
+        doc,
+        query,
+        {0: 100},
+        pos=0,
+        fuzzy_func="simple",
+        min_r2=70,
+        ignore_case=True,
+        flex=1,
+    ) == (0, 1, 100)
+    assert spy.call_count == 0
+
+
+def test__span_text_clamps_to_available_tokens(
+    searcher: FuzzySearcher, scan_example: Doc
+) -> None:
+    """It slices token text and clamps out of range boundaries."""
+    text, starts, ends = map_tokens_to_chars(scan_example)
+    assert searcher._span_text(text, starts, ends, 2, 4) == "call me"
+    assert searcher._span_text(text, starts, ends, -1, 2) == "Don't"
+    assert searcher._span_text(text, starts, ends, 4, 10) == "Sh1rley"
+    assert searcher._span_text(text, starts, ends, 3, 3) == ""
+
+
 def test__filter_overlapping_matches_filters_correctly(
     searcher: FuzzySearcher,
 ) -> None:
@@ -199,6 +344,30 @@ def test__filter_overlapping_matches_filters_correctly(
     assert searcher._filter_overlapping_matches(matches) == [(1, 2, 80)]
 
 
+def test__filter_overlapping_matches_keeps_adjacent_matches(
+    searcher: FuzzySearcher,
+) -> None:
+    """It keeps matches that touch but do not share tokens."""
+    matches = [(2, 4, 90), (4, 5, 85), (0, 2, 80), (1, 3, 75)]
+    assert searcher._filter_overlapping_matches(matches) == [
+        (2, 4, 90),
+        (4, 5, 85),
+        (0, 2, 80),
+    ]
+
+
+def test__filter_overlapping_matches_checks_both_neighbours(
+    searcher: FuzzySearcher,
+) -> None:
+    """It drops matches overlapping a kept match on either side."""
+    matches = [(3, 5, 95), (8, 10, 90), (4, 6, 85), (6, 9, 80), (5, 8, 75)]
+    assert searcher._filter_overlapping_matches(matches) == [
+        (3, 5, 95),
+        (8, 10, 90),
+        (5, 8, 75),
+    ]
+
+
 def test_match_finds_best_matches(searcher: FuzzySearcher, nlp: Language) -> None:
     """It returns all the fuzzy matches that meet threshold correctly sorted."""
     doc = nlp("chiken from Popeyes is better than chken from Chick-fil-A")
@@ -209,6 +378,20 @@ def test_match_finds_best_matches(searcher: FuzzySearcher, nlp: Language) -> Non
     ]
 
 
+def test_match_with_token_set(searcher: FuzzySearcher, nlp: Language) -> None:
+    """It returns token_set matches that meet the default thresholds."""
+    doc = nlp.make_doc("a Jabbar Shirley")
+    query = nlp.make_doc("a over")
+    assert searcher.match(doc, query, fuzzy_func="token_set") == [(0, 1, 100)]
+
+
+def test_match_with_weighted(searcher: FuzzySearcher, nlp: Language) -> None:
+    """It returns weighted matches that meet the default thresholds."""
+    doc = nlp.make_doc("chicken moon moon Abdul")
+    query = nlp.make_doc("Sh1rley moon big")
+    assert searcher.match(doc, query, fuzzy_func="weighted") == [(2, 4, 86)]
+
+
 def test_match_return_empty_list_when_no_matches_after_scan(
     searcher: FuzzySearcher, nlp: Language
 ) -> None:
@@ -236,6 +419,22 @@ def test_match_with_n_less_than_actual_matches(
     assert searcher.match(doc, query, n=2) == [(0, 1, 100), (2, 3, 100)]
 
 
+def test_scan_returns_initial_matches_for_each_query(
+    searcher: FuzzySearcher, nlp: Language, scan_example: Doc
+) -> None:
+    """It returns the _scan_doc matches of each query in order."""
+    queries = [nlp.make_doc("Shirley"), nlp.make_doc("xenomorph")]
+    assert searcher.scan(scan_example, queries, min_r1=30) == [{4: 86}, {}]
+
+
+def test_scan_raises_error_if_queries_not_Docs(
+    searcher: FuzzySearcher, scan_example: Doc
+) -> None:
+    """It raises a TypeError if any query is not a Doc."""
+    with pytest.raises(TypeError):
+        searcher.scan(scan_example, ["Shirley"])
+
+
 def test_match_raises_error_when_doc_not_Doc(
     searcher: FuzzySearcher, nlp: Language
 ) -> None:
@@ -145,6 +145,12 @@ def test_matcher_returns_empty_list_if_no_matches(
     assert matcher(temp_doc) == []
 
 
+def test_matcher_raises_error_if_doc_not_Doc(matcher: FuzzyMatcher) -> None:
+    """Calling the matcher on something other than a Doc raises a TypeError."""
+    with pytest.raises(TypeError):
+        matcher("No matches here.")
+
+
 def test_matcher_uses_on_match_callback(
     matcher: FuzzyMatcher, doc: Doc, nlp: Language
 ) -> None:
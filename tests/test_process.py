@@ -0,0 +1,34 @@
+"""Tests for process module."""
+from spacy.language import Language
+
+from spaczz.process import map_chars_to_tokens, map_tokens_to_chars
+
+
+def test_map_chars_to_tokens(nlp: Language) -> None:
+    """It maps each non-whitespace character to its token."""
+    doc = nlp.make_doc("Hi there.")
+    assert map_chars_to_tokens(doc) == {0: 0, 1: 0, 3: 1, 4: 1, 5: 1, 6: 1, 7: 1, 8: 2}
+
+
+def test_map_tokens_to_chars_with_doc(nlp: Language) -> None:
+    """It returns the doc text and the character boundaries of each token."""
+    doc = nlp.make_doc("Hi there.")
+    text, starts, ends = map_tokens_to_chars(doc)
+    assert text == "Hi there."
+    assert [text[s:e] for s, e in zip(starts, ends)] == ["Hi", "there", "."]
+
+
+def test_map_tokens_to_chars_with_span(nlp: Language) -> None:
+    """It returns boundaries relative to the span text."""
+    doc = nlp.make_doc("Well hi there friend")
+    text, starts, ends = map_tokens_to_chars(doc[1:3])
+    assert text == "hi there"
+    assert (starts, ends) == ([0, 3], [2, 8])
+
+
+def test_map_tokens_to_chars_with_lower(nlp: Language) -> None:
+    """It returns lower-cased text with boundaries matching it."""
+    doc = nlp.make_doc("Go \u0130stanbul")
+    text, starts, ends = map_tokens_to_chars(doc, lower=True)
+    assert text == "go \u0130stanbul".lower()
+    assert [text[s:e] for s, e in zip(starts, ends)] == [t.lower_ for t in doc]
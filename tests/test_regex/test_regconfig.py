@@ -3,7 +3,7 @@ import pytest
 import regex
 
 from spaczz.regex._commonregex import _commonregex
-from spaczz.regex.regexconfig import RegexConfig, RegexParseError
+from spaczz.regex.regexconfig import _compile_regex, RegexConfig, RegexParseError
 
 
 @pytest.fixture
@@ -43,3 +43,24 @@ def test_invalid_regexfor_regex_compile_raises_error(config: RegexConfig) -> Non
     """Using an invalid type raises a RegexParseError."""
     with pytest.raises(RegexParseError):
         config.parse_regex("[")
+
+
+def test_parse_regex_reuses_compiled_pattern(config: RegexConfig) -> None:
+    """It looks up patterns it has already compiled instead of recompiling them."""
+    _compile_regex.cache_clear()
+    config.parse_regex("(?i)Test")
+    RegexConfig().parse_regex("(?i)Test")
+    info = _compile_regex.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_predefs_are_shared_between_configs(config: RegexConfig) -> None:
+    """It shares the compiled predefined patterns between configs."""
+    assert config._predefs["phones"] is RegexConfig()._predefs["phones"]
+
+
+def test_adding_to_predefs_does_not_change_other_configs(config: RegexConfig) -> None:
+    """It keeps patterns added to one config out of the shared patterns."""
+    config._predefs["test"] = regex.compile("test")
+    assert "test" not in _commonregex
+    assert "test" not in RegexConfig()._predefs
@@ -1,8 +1,10 @@
 """Tests for the regexsearcher module."""
 import pytest
+from pytest_mock import MockFixture
 import regex
 from spacy.language import Language
 
+from spaczz.regex import regexsearcher
 from spaczz.regex._commonregex import _commonregex
 from spaczz.regex.regexconfig import RegexConfig
 from spaczz.regex.regexsearcher import RegexSearcher
@@ -31,7 +33,7 @@ def test_regexsearcher_uses_passed_config() -> None:
 
 def test_regexsearcher_raises_error_if_config_is_not_regexconfig() -> None:
     """It raises a TypeError if config is not recognized string or RegexConfig."""
-    with pytest.raises(TypeError):
+    with pytest.raises(TypeError, match="config must be one of"):
         RegexSearcher(config="Will cause error")
 
 
@@ -59,6 +61,15 @@ def test_multi_match_will_expand_on_partial_match_if_partials(
     assert matches == [(5, 6, (0, 0, 0))]
 
 
+def test_multi_match_will_expand_partial_match_on_first_token(
+    searcher: RegexSearcher, nlp: Language
+) -> None:
+    """It extends partial matches that start in the first token of doc."""
+    doc = nlp("USA is where we want to be.")
+    matches = searcher.match(doc, "[Uu](nited|\\.?) ?[Ss](tates|\\.?)")
+    assert matches == [(0, 1, (0, 0, 0))]
+
+
 def test_multi_match_will_not_expand_if_not_partials(
     searcher: RegexSearcher, nlp: Language
 ) -> None:
@@ -70,6 +81,16 @@ def test_multi_match_will_not_expand_if_not_partials(
     assert matches == []
 
 
+def test_multi_match_only_maps_chars_for_partial_matches(
+    searcher: RegexSearcher, nlp: Language, mocker: MockFixture
+) -> None:
+    """It does not map characters to tokens if every match is a full span."""
+    spy = mocker.spy(regexsearcher, "map_chars_to_tokens")
+    doc = nlp("My phone number is (555) 555-5555.")
+    searcher.match(doc, "phones", predef=True)
+    assert spy.call_count == 0
+
+
 def test_multi_match_will_not_match_if_regex_starts_ends_with_space(
     searcher: RegexSearcher, nlp: Language
 ) -> None:
@@ -81,10 +102,67 @@ def test_multi_match_will_not_match_if_regex_starts_ends_with_space(
     assert matches == []
 
 
+def test_multi_match_with_overlapped(searcher: RegexSearcher, nlp: Language) -> None:
+    """It also returns overlapping matches if overlapped."""
+    doc = nlp("New York City")
+    assert searcher.match(doc, "\\w+ \\w+") == [(0, 2, (0, 0, 0))]
+    assert searcher.match(doc, "\\w+ \\w+", overlapped=True) == [
+        (0, 2, (0, 0, 0)),
+        (1, 3, (0, 0, 0)),
+    ]
+
+
+def test_multi_match_with_overlapped_and_partial(
+    searcher: RegexSearcher, nlp: Language
+) -> None:
+    """It returns each extended span once if overlapped and partial."""
+    doc = nlp("abc def ghi")
+    assert searcher.match(doc, "\\w+ \\w", overlapped=True) == [
+        (0, 2, (0, 0, 0)),
+        (1, 3, (0, 0, 0)),
+    ]
+
+
 def test_multi_match_raises_error_if_regex_str_not_str(
     searcher: RegexSearcher, nlp: Language
 ) -> None:
     """It raises a type error if regex_str is not a string."""
     doc = nlp("My phone number is (555) 555-5555.")
-    with pytest.raises(TypeError):
+    with pytest.raises(TypeError, match="regex_str must be a str"):
         searcher.match(doc, 1, predef=True)
+
+
+def test_match_batch_matches_each_doc(searcher: RegexSearcher, nlp: Language) -> None:
+    """It returns the matches of each doc in order."""
+    docs = [nlp("Call (555) 555-5555."), nlp("No phone here."), nlp("USA")]
+    assert list(searcher.match_batch(docs, "phones", predef=True)) == [
+        [(1, 7, (0, 0, 0))],
+        [],
+        [],
+    ]
+
+
+def test_match_batch_raises_error_if_regex_str_not_str(
+    searcher: RegexSearcher, nlp: Language
+) -> None:
+    """It raises a type error if regex_str is not a string before iterating."""
+    with pytest.raises(TypeError, match="regex_str must be a str"):
+        searcher.match_batch([nlp("No phone here.")], 1)
+
+
+def test_get_matcher_returns_same_matches_as_match(
+    searcher: RegexSearcher, nlp: Language
+) -> None:
+    """It returns a function that matches like match with the same pattern."""
+    doc = nlp("We want to identify 'USA' and (555) 555-5555.")
+    find_usa = searcher.get_matcher("[Uu](nited|\\.?) ?[Ss](tates|\\.?)")
+    assert find_usa(doc) == searcher.match(doc, "[Uu](nited|\\.?) ?[Ss](tates|\\.?)")
+    assert find_usa(doc, partial=False) == []
+
+
+def test_get_matcher_raises_error_if_regex_str_not_str(
+    searcher: RegexSearcher,
+) -> None:
+    """It raises a type error if regex_str is not a string."""
+    with pytest.raises(TypeError, match="regex_str must be a str"):
+        searcher.get_matcher(1)